@@ -6,134 +6,183 @@ from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.spinner import Spinner
 from kivy.uix.button import Button
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.uix.popup import Popup
-from datetime import datetime
-import random
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import json
+import os
 import requests
+from requests.adapters import HTTPAdapter
 import threading
+import time
+from urllib3.util.retry import Retry
 from kivy.clock import Clock
-
-# ------------------- CC Validation Functions -------------------
-
-def luhn_check(card_number):
-    """Luhn algorithm validation"""
-    card_number = ''.join(c for c in card_number if c.isdigit())
-    
-    digits = [int(d) for d in card_number]
-    digits.reverse()
-    
-    total = 0
-    for i, digit in enumerate(digits):
-        if i % 2 == 1:
-            digit *= 2
-            if digit > 9:
-                digit -= 9
-        total += digit
+from kivy.logger import Logger
+from cc_core import (
+    digits_only,
+    format_card,
+    generate_ccs_from_bin,
+    generate_cvv,
+    generate_exp_date,
+    get_card_type,
+    validate_cc_entries,
+)
+
+# ------------------- Background Work -------------------
+
+# One keep-alive session so repeated lookups reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    # Return the final 429/5xx response instead of raising, so it reaches the miss
+    # cache; ignore Retry-After so a long server delay cannot hold a shared worker
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503],
+                      raise_on_status=False, respect_retry_after_header=False),
+))
+
+# Connect and read timeouts for each BIN lookup attempt
+_BIN_TIMEOUT = (3, 5)
+
+# BIN lookups run on daemon threads so a stalled request never delays app exit;
+# the semaphore keeps at most four of them talking to binlist at once
+_BIN_LOOKUP_SLOTS = threading.BoundedSemaphore(4)
+
+def _run_bin_lookup(target):
+    """Run a network lookup on a short-lived daemon thread"""
+    def run():
+        with _BIN_LOOKUP_SLOTS:
+            target()
+    threading.Thread(target=run, daemon=True).start()
+
+# Bounded worker pool for CPU work that must stay off the UI thread; only
+# short, non-blocking jobs go here because the interpreter joins it at exit
+_EXEC = ThreadPoolExecutor(max_workers=4)
+
+# Validation results are handed to the UI thread this many at a time
+VALIDATION_CHUNK_SIZE = 32
+
+def _batched(iterable, n):
+    """Yield successive lists of up to n items (itertools recipe)"""
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, n))
+        if not batch:
+            return
+        yield batch
+
+# ------------------- BIN Lookup -------------------
+
+# Successful BIN lookups, most recently used last
+_BIN_CACHE_SIZE = 1024
+_bin_cache = OrderedDict()
+_bin_cache_lock = threading.Lock()
+
+# Failed BIN lookups are only remembered briefly
+_BIN_MISS_TTL = 60
+_bin_misses = {}
+
+def _record_bin_miss(bin_number):
+    """Remember a failed lookup, dropping expired misses; caller holds the lock"""
+    now = time.monotonic()
+    for expired in [b for b, missed_at in _bin_misses.items() if now - missed_at >= _BIN_MISS_TTL]:
+        del _bin_misses[expired]
+    _bin_misses[bin_number] = now
+
+def _fetch_bin_raw(bin_number):
+    """Return (bank, country, type, scheme) for a BIN, or None if not available"""
+    with _bin_cache_lock:
+        if bin_number in _bin_cache:
+            _bin_cache.move_to_end(bin_number)
+            return _bin_cache[bin_number]
+        missed_at = _bin_misses.get(bin_number)
+        if missed_at is not None and time.monotonic() - missed_at < _BIN_MISS_TTL:
+            return None
+
+    url = f"https://lookup.binlist.net/{bin_number}"
+    headers = {
+        'Accept-Version': '3'
+    }
     
-    return total % 10 == 0
-
-def validate_exp_date(month, year):
-    """Validate expiration date"""
+    response = _SESSION.get(url, headers=headers, timeout=_BIN_TIMEOUT)
+    if response.status_code != 200:
+        with _bin_cache_lock:
+            _record_bin_miss(bin_number)
+        return None
+
+    data = response.json()
+    info = (
+        data.get('bank', {}).get('name', 'Unknown Bank'),
+        data.get('country', {}).get('name', 'Unknown Country'),
+        data.get('type', 'Unknown Type'),
+        data.get('scheme', 'Unknown Scheme'),
+    )
+    with _bin_cache_lock:
+        _bin_misses.pop(bin_number, None)
+        _bin_cache[bin_number] = info
+        _bin_cache.move_to_end(bin_number)
+        if len(_bin_cache) > _BIN_CACHE_SIZE:
+            _bin_cache.popitem(last=False)
+    return info
+
+def load_bin_cache(path):
+    """Restore BIN lookups saved by a previous run; a bad file is ignored"""
     try:
-        current_date = datetime.now()
-        exp_date = datetime(int(year), int(month), 1)
-        return exp_date > current_date
-    except:
-        return False
-
-def validate_cvv(cvv):
-    """Validate CVV format"""
-    return cvv.isdigit() and len(cvv) in [3, 4]
-
-def get_card_type(card_number):
-    """Determine card type from number"""
-    card_number = ''.join(c for c in card_number if c.isdigit())
-    
-    if card_number.startswith('4'):
-        return "Visa"
-    elif card_number.startswith(('51','52','53','54','55','22','23','24','25','26','27')):
-        return "Mastercard"
-    elif card_number.startswith(('34','37')):
-        return "American Express"
-    elif card_number.startswith(('300','301','302','303','304','305','36','38')):
-        return "Diners Club"
-    elif card_number.startswith(('6011','65','64','622')):
-        return "Discover"
-    elif card_number.startswith(('35')):
-        return "JCB"
-    return "Unknown"
+        with open(path, encoding='utf-8') as f:
+            saved = json.load(f)
+    except Exception:
+        return
+    if not isinstance(saved, dict):
+        return
+    with _bin_cache_lock:
+        for bin_number, info in list(saved.items())[-_BIN_CACHE_SIZE:]:
+            if isinstance(info, list) and len(info) == 4 and all(isinstance(v, str) for v in info):
+                _bin_cache[bin_number] = tuple(info)
+
+def save_bin_cache(path):
+    """Persist BIN lookups for the next run"""
+    with _bin_cache_lock:
+        saved = dict(_bin_cache)
+    # Write to a temporary file first so an interrupted save never leaves a broken cache
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(saved, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
 
 def check_bin_info(card_number):
     """Get BIN information from free online databases"""
     try:
-        bin_number = card_number[:6]
-        url = f"https://lookup.binlist.net/{bin_number}"
-        headers = {
-            'Accept-Version': '3'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            bank_name = data.get('bank', {}).get('name', 'Unknown Bank')
-            country = data.get('country', {}).get('name', 'Unknown Country')
-            card_type = data.get('type', 'Unknown Type')
-            scheme = data.get('scheme', 'Unknown Scheme')
-            
-            return f"BIN Info: {bank_name} ({country}) - {card_type} {scheme}"
-        else:
-            return "BIN Info: Not available"
+        info = _fetch_bin_raw(card_number[:6])
     except:
         return "BIN Info: Error fetching data"
+    if info is None:
+        return "BIN Info: Not available"
+    bank_name, country, card_type, scheme = info
+    return f"BIN Info: {bank_name} ({country}) - {card_type} {scheme}"
 
-def generate_check_digit(partial_card):
-    """Generate Luhn check digit"""
-    partial_card = ''.join(c for c in partial_card if c.isdigit())
-    
-    digits = [int(d) for d in partial_card]
-    digits.reverse()
-    
-    total = 0
-    for i, digit in enumerate(digits):
-        if i % 2 == 0:
-            digit *= 2
-            if digit > 9:
-                digit -= 9
-        total += digit
-    
-    return (10 - (total % 10)) % 10
-
-def generate_cc_from_bin(bin_number):
-    """Generate valid CC number from BIN"""
-    bin_number = ''.join(c for c in bin_number if c.isdigit())
-    
-    card_type = get_card_type(bin_number)
-    if card_type == "American Express":
-        card_length = 15
-    else:
-        card_length = 16
-    
-    missing_digits = card_length - len(bin_number)
-    if missing_digits < 1:
-        return "Invalid BIN"
-    
-    random_digits = ''.join([str(random.randint(0, 9)) for _ in range(missing_digits - 1)])
-    partial_card = bin_number + random_digits
-    check_digit = generate_check_digit(partial_card)
-    return partial_card + str(check_digit)
+# ------------------- Shared Results Panel -------------------
 
-def generate_exp_date():
-    """Generate random expiration date"""
-    month = f"{random.randint(1,12):02}"
-    year = str(random.randint(datetime.now().year + 1, datetime.now().year + 6))
-    return month, year
+RESULT_LINE_HEIGHT = 22
 
-def generate_cvv():
-    """Generate random CVV"""
-    return ''.join([str(random.randint(0,9)) for _ in range(3)])
+class ResultLine(Label):
+    """Single row of the results list"""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.font_size = 14
+        self.halign = "left"
+        self.valign = "middle"
+        self.shorten = True
+        self.shorten_from = "right"
+        self.bind(size=self.update_text_size)
 
-# ------------------- Shared Results Panel -------------------
+    def update_text_size(self, instance, size):
+        self.text_size = size
 
 class ResultsPanel(BoxLayout):
     def __init__(self, **kwargs):
@@ -145,6 +194,8 @@ class ResultsPanel(BoxLayout):
         # Store raw CC data for validation
         self.raw_cc_data = []
         self.checking = False
+        # Bumped whenever a running check's output should be discarded
+        self.run_id = 0
         
         # Add button row at the top
         self.button_row = BoxLayout(size_hint_y=None, height=40, spacing=5)
@@ -154,24 +205,42 @@ class ResultsPanel(BoxLayout):
         self.button_row.add_widget(self.clear_btn)
         self.add_widget(self.button_row)
         
-        # Scrollable output area
-        self.scroll = ScrollView(size_hint=(1,1))
-        self.output = Label(text="", font_size=14, valign="top", halign="left", size_hint_y=None)
-        self.output.bind(texture_size=self.update_height)
-        self.scroll.add_widget(self.output)
-        self.add_widget(self.scroll)
-
-    def update_height(self, instance, size):
-        self.output.height = self.output.texture_size[1]
-        self.output.text_size = (self.scroll.width, None)
+        # Recycled output rows; only the visible ones get widgets
+        self.rv = RecycleView(size_hint=(1,1))
+        self.rv.viewclass = ResultLine
+        rows = RecycleBoxLayout(default_size=(None, RESULT_LINE_HEIGHT), default_size_hint=(1, None),
+                                size_hint_y=None, orientation="vertical")
+        rows.bind(minimum_height=rows.setter("height"))
+        self.rv.add_widget(rows)
+        self.add_widget(self.rv)
 
     def append(self, text, is_cc_data=False):
-        self.output.text += text + "\n"
-        if is_cc_data and "|" in text and not text.startswith("Generated"):
-            self.raw_cc_data.append(text)
+        """Append one line; CC data is a (display, raw) pair"""
+        self.extend([text], is_cc_data)
+
+    def extend(self, lines, is_cc_data=False):
+        """Append many lines with a single data update; CC data is (display, raw) pairs"""
+        if not lines:
+            return
+        if is_cc_data:
+            self.raw_cc_data.extend(raw for _, raw in lines if raw)
+            lines = [display for display, _ in lines]
+        self.rv.data.extend({"text": row} for line in lines for row in line.split("\n"))
+
+    def start_run(self):
+        """Begin a background check and return its tag"""
+        self.run_id += 1
+        self.checking = True
+        return self.run_id
+
+    def stop_run(self):
+        """Drop any output still coming from a running check"""
+        self.run_id += 1
+        self.checking = False
 
     def clear(self):
-        self.output.text = ""
+        self.stop_run()
+        self.rv.data = []
         self.raw_cc_data = []
         
     def get_cc_entries(self):
@@ -212,7 +281,7 @@ class BinScreen(Screen):
         self.add_widget(layout)
 
     def extract_bin(self, instance):
-        cc_number = self.cc_input.text.strip().replace(" ", "")
+        cc_number = digits_only(self.cc_input.text)
         bin_length = int(self.bin_spinner.text)
 
         if not cc_number or len(cc_number) < bin_length:
@@ -224,7 +293,7 @@ class BinScreen(Screen):
         self.results_panel.append(f"BIN ({bin_length}): {bin_value} → {card_type}")
 
     def check_bin_info(self, instance):
-        cc_number = self.cc_input.text.strip().replace(" ", "")
+        cc_number = digits_only(self.cc_input.text)
         
         if not cc_number or len(cc_number) < 6:
             self.show_popup("Error", "Please enter a valid CC number")
@@ -238,12 +307,14 @@ class BinScreen(Screen):
             bin_info = check_bin_info(cc_number)
             Clock.schedule_once(lambda dt: self.results_panel.append(bin_info))
         
-        threading.Thread(target=fetch_bin_info, daemon=True).start()
+        _run_bin_lookup(fetch_bin_info)
 
     def show_popup(self, title, message):
         popup = Popup(title=title, content=Label(text=message), size_hint=(0.6, 0.4))
         popup.open()
 
+MAX_CARDS = 100
+
 class GeneratorScreen(Screen):
     def __init__(self, results_panel, **kwargs):
         super().__init__(**kwargs)
@@ -257,9 +328,9 @@ class GeneratorScreen(Screen):
         self.bin_input = TextInput(multiline=False)
         grid.add_widget(self.bin_input)
 
-        grid.add_widget(Label(text="Number of Cards (1-100):"))
-        self.count_spinner = Spinner(values=[str(i) for i in range(1, 101)], text="1")
-        grid.add_widget(self.count_spinner)
+        grid.add_widget(Label(text=f"Number of Cards (1-{MAX_CARDS}):"))
+        self.count_input = TextInput(text="1", multiline=False, input_filter='int')
+        grid.add_widget(self.count_input)
 
         layout.add_widget(grid)
 
@@ -270,97 +341,42 @@ class GeneratorScreen(Screen):
         self.add_widget(layout)
 
     def generate_cards(self, instance):
-        bin_input = self.bin_input.text.strip().replace(" ", "")
-        count = int(self.count_spinner.text)
+        bin_input = digits_only(self.bin_input.text)
+        try:
+            count = int(self.count_input.text)
+        except ValueError:
+            count = 1
+        count = max(1, min(MAX_CARDS, count))
 
         if not bin_input or len(bin_input) < 6:
             self.show_popup("Error", "Please enter a valid BIN (at least 6 digits)")
             return
 
-        self.results_panel.append(f"Generated {count} cards with BIN: {bin_input}")
+        cards = generate_ccs_from_bin(bin_input, count)
+        if not cards:
+            self.show_popup("Error", "BIN is too long for this card type")
+            return
+
+        lines = [(f"Generated {count} cards with BIN: {bin_input}", None)]
         
-        for i in range(count):
-            card = generate_cc_from_bin(bin_input)
+        for card in cards:
             exp_m, exp_y = generate_exp_date()
             cvv = generate_cvv()
             
-            # Format based on card type
-            card_type = get_card_type(card)
-            if card_type == "American Express":
-                formatted = f"{card[:4]} {card[4:10]} {card[10:]}"
-            else:
-                formatted = ' '.join([card[i:i+4] for i in range(0, len(card), 4)])
+            formatted = format_card(card, get_card_type(card))
                 
             # Display formatted but store raw for validation
-            self.results_panel.append(formatted + f"|{exp_m}|{exp_y}|{cvv}", is_cc_data=True)
+            details = f"|{exp_m}|{exp_y}|{cvv}"
+            lines.append((formatted + details, card + details))
+
+        # New cards invalidate a check still streaming results for the old ones
+        self.results_panel.stop_run()
+        self.results_panel.extend(lines, is_cc_data=True)
 
     def show_popup(self, title, message):
         popup = Popup(title=title, content=Label(text=message), size_hint=(0.6, 0.4))
         popup.open()
 
-# ------------------- Validation Functions -------------------
-
-def validate_cc_entries(entries):
-    """Validate a list of CC entries"""
-    results = []
-    valid_count = 0
-    total_count = 0
-    
-    for entry in entries:
-        if not entry.strip():
-            continue
-            
-        total_count += 1
-        try:
-            # Parse the entry - remove any spaces from the card number part
-            parts = entry.split("|")
-            if len(parts) < 4:
-                results.append(f"[Invalid Format] {entry}")
-                continue
-                
-            # Clean the card number (remove spaces)
-            cc_number = ''.join(c for c in parts[0] if c.isdigit())
-            month, year, cvv = parts[1], parts[2], parts[3]
-            
-            luhn_valid = luhn_check(cc_number)
-            exp_valid = validate_exp_date(month, year)
-            cvv_valid = validate_cvv(cvv)
-            card_type = get_card_type(cc_number)
-            is_valid = luhn_valid and exp_valid and cvv_valid
-            
-            if is_valid:
-                valid_count += 1
-
-            # Format the card number for display
-            if card_type == "American Express":
-                formatted_cc = f"{cc_number[:4]} {cc_number[4:10]} {cc_number[10:]}"
-            else:
-                formatted_cc = ' '.join([cc_number[i:i+4] for i in range(0, len(cc_number), 4)])
-
-            status = "VALID" if is_valid else "INVALID"
-            result_text = f"{formatted_cc} ({card_type}) → {status}"
-            
-            # Add details for invalid cards
-            if not is_valid:
-                reasons = []
-                if not luhn_valid:
-                    reasons.append("Luhn check failed")
-                if not exp_valid:
-                    reasons.append("Expired or invalid date")
-                if not cvv_valid:
-                    reasons.append("Invalid CVV")
-                result_text += f" [{', '.join(reasons)}]"
-            
-            results.append(result_text)
-            
-        except Exception as e:
-            results.append(f"[Error processing] {entry}: {str(e)}")
-
-    # Add summary
-    results.append(f"\nSummary: {valid_count}/{total_count} valid cards")
-    
-    return results
-
 # ------------------- Main App -------------------
 
 class CreditCardApp(App):
@@ -392,6 +408,16 @@ class CreditCardApp(App):
         self.results_panel.clear_btn.bind(on_press=self.clear_results)
         
         return root
+
+    def _bin_cache_path(self):
+        return os.path.join(self.user_data_dir, "bin_cache.json")
+
+    def on_start(self):
+        load_bin_cache(self._bin_cache_path())
+
+    def on_stop(self):
+        save_bin_cache(self._bin_cache_path())
+        _EXEC.shutdown(wait=False, cancel_futures=True)
     
     def check_generated_cards(self, instance):
         """Check all generated cards in the results panel"""
@@ -400,14 +426,42 @@ class CreditCardApp(App):
         if not entries:
             self.show_popup("Info", "No generated cards found to check")
             return
+
+        if self.results_panel.checking:
+            return
             
         # Clear and add validation results
-        self.results_panel.clear()
-        self.results_panel.append("=== VALIDATION RESULTS ===\n")
+        panel = self.results_panel
+        panel.clear()
+        panel.append("=== VALIDATION RESULTS ===\n")
+        run = panel.start_run()
+
+        def deliver(chunk):
+            if panel.run_id == run:
+                panel.extend(chunk)
+
+        def finish(error):
+            if panel.run_id != run:
+                return
+            if error is not None:
+                panel.append(f"[Error validating] {error}")
+            panel.checking = False
+        
+        # Validate off the UI thread; widgets are only touched from Clock callbacks
+        def validate():
+            error = None
+            try:
+                for chunk in _batched(validate_cc_entries(entries), VALIDATION_CHUNK_SIZE):
+                    if panel.run_id != run:
+                        break
+                    Clock.schedule_once(lambda dt, c=chunk: deliver(c))
+            except Exception as e:
+                Logger.exception("CCTool: validation failed")
+                error = e
+            finally:
+                Clock.schedule_once(lambda dt: finish(error))
         
-        validation_results = validate_cc_entries(entries)
-        for result in validation_results:
-            self.results_panel.append(result)
+        _EXEC.submit(validate)
     
     def clear_results(self, instance):
         """Clear the results panel"""
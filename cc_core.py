@@ -0,0 +1,241 @@
+"""Card number helpers with no Kivy or network dependencies.
+
+Everything here is fully annotated plain Python so the module can be
+compiled as-is with mypyc (``mypyc cc_core.py``); cc.py imports it the
+same way either way.
+"""
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+import random
+import re
+
+# ------------------- CC Validation Functions -------------------
+
+# Card numbers are kept as ASCII-digit strings; user input is cleaned once on entry
+_NON_DIGITS = re.compile(r'[^0-9]')
+
+def digits_only(text: str) -> str:
+    """Strip everything but ASCII digits from user input"""
+    return _NON_DIGITS.sub('', text)
+
+# Maps each digit to its Luhn doubling, with 9 already subtracted where needed
+_LUHN_DOUBLE_TABLE = str.maketrans('0123456789', '0246813579')
+
+def _luhn_sum(digits: str, double_last: bool) -> int:
+    """Luhn digit sum of a digits-only string, doubling every other digit from the right"""
+    n = len(digits)
+    start = (n - int(double_last)) % 2
+    doubled = digits[start::2].translate(_LUHN_DOUBLE_TABLE)
+    # Byte sums of ASCII digits run in C; subtract the '0' offsets afterwards
+    return sum((doubled + digits[1 - start::2]).encode()) - 48 * n
+
+def luhn_check(card_number: str) -> bool:
+    """Luhn algorithm validation (expects a digits-only string)"""
+    return _luhn_sum(card_number, False) % 10 == 0
+
+def _exp_valid(month: str, year: str, current_year: int, current_month: int) -> bool:
+    """Expiration check against a precomputed current year and month"""
+    try:
+        y, m = int(year), int(month)
+    except ValueError:
+        return False
+    # Same bounds datetime enforces
+    if not (1 <= m <= 12 and 1 <= y <= 9999):
+        return False
+    return (y, m) > (current_year, current_month)
+
+def validate_exp_date(month: str, year: str) -> bool:
+    """Validate expiration date"""
+    now = datetime.now()
+    return _exp_valid(month, year, now.year, now.month)
+
+def validate_cvv(cvv: str) -> bool:
+    """Validate CVV format"""
+    return cvv.isdigit() and len(cvv) in [3, 4]
+
+# Card type indexed by the first two digits; None marks prefixes that need
+# the third or fourth digit (30x Diners Club, 6011 and 622 Discover)
+_TYPE_BY_2_DIGITS: list[str | None] = ["Unknown"] * 100
+for _p in range(40, 50):
+    _TYPE_BY_2_DIGITS[_p] = "Visa"
+for _p in (51, 52, 53, 54, 55, 22, 23, 24, 25, 26, 27):
+    _TYPE_BY_2_DIGITS[_p] = "Mastercard"
+for _p in (34, 37):
+    _TYPE_BY_2_DIGITS[_p] = "American Express"
+for _p in (36, 38):
+    _TYPE_BY_2_DIGITS[_p] = "Diners Club"
+for _p in (64, 65):
+    _TYPE_BY_2_DIGITS[_p] = "Discover"
+_TYPE_BY_2_DIGITS[35] = "JCB"
+for _p in (30, 60, 62):
+    _TYPE_BY_2_DIGITS[_p] = None
+
+def get_card_type(card_number: str) -> str:
+    """Determine card type from number (expects a digits-only string)"""
+    if len(card_number) < 2:
+        return "Visa" if card_number == "4" else "Unknown"
+    card_type = _TYPE_BY_2_DIGITS[int(card_number[:2])]
+    if card_type is not None:
+        return card_type
+    if card_number.startswith(('300','301','302','303','304','305')):
+        return "Diners Club"
+    if card_number.startswith(('6011','622')):
+        return "Discover"
+    return "Unknown"
+
+# ------------------- CC Generation Functions -------------------
+
+def generate_check_digit(partial_card: str) -> int:
+    """Generate Luhn check digit (expects a digits-only string)"""
+    return (10 - _luhn_sum(partial_card, True) % 10) % 10
+
+# Private generator so card generation does not share the global one
+_rng = random.Random()
+
+def _card_length(bin_number: str) -> int:
+    """Total card length implied by the BIN's card type"""
+    if get_card_type(bin_number) == "American Express":
+        return 15
+    return 16
+
+# Up to 18 digits come from one 64-bit draw; draws at or above the largest
+# multiple of 10**18 below 2**64 are rejected so every digit stays uniform
+_DIGITS_PER_DRAW = 18
+_DRAW_MODULUS = 10 ** _DIGITS_PER_DRAW
+_DRAW_LIMIT = (2 ** 64 // _DRAW_MODULUS) * _DRAW_MODULUS
+
+# Longer strings use one randrange per chunk, which measures faster beyond a
+# single draw; chunks stay under Python's int-to-str digit limit
+_RANDOM_DIGITS_CHUNK = 1000
+
+def _random_digits(n: int) -> str:
+    """Return n uniformly random decimal digits as a string"""
+    if n <= 0:
+        return ''
+    if n <= _DIGITS_PER_DRAW:
+        r = _rng.getrandbits(64)
+        while r >= _DRAW_LIMIT:
+            r = _rng.getrandbits(64)
+        return f"{r % _DRAW_MODULUS:018d}"[:n]
+    chunks = []
+    while n > 0:
+        k = min(n, _RANDOM_DIGITS_CHUNK)
+        chunks.append(f"{_rng.randrange(10 ** k):0{k}d}")
+        n -= k
+    return ''.join(chunks)
+
+def _complete_card(bin_number: str, card_length: int) -> str:
+    """Pad a BIN with random digits and append the Luhn check digit"""
+    partial_card = bin_number + _random_digits(card_length - len(bin_number) - 1)
+    check_digit = generate_check_digit(partial_card)
+    return partial_card + str(check_digit)
+
+def generate_cc_from_bin(bin_number: str) -> str:
+    """Generate valid CC number from a digits-only BIN"""
+    card_length = _card_length(bin_number)
+    if card_length - len(bin_number) < 1:
+        return "Invalid BIN"
+
+    return _complete_card(bin_number, card_length)
+
+def generate_ccs_from_bin(bin_number: str, count: int) -> list[str]:
+    """Generate a batch of valid CC numbers sharing one digits-only BIN"""
+    card_length = _card_length(bin_number)
+    if card_length - len(bin_number) < 1:
+        return []
+
+    # Draw the padding for the whole batch at once, then slice it per card
+    pad_length = card_length - len(bin_number) - 1
+    pads = _random_digits(pad_length * count)
+    # The BIN's share of the Luhn sum is the same for every card in the batch
+    bin_sum = _luhn_sum(bin_number, pad_length % 2 == 0)
+    cards = []
+    for i in range(count):
+        pad = pads[i * pad_length:(i + 1) * pad_length]
+        check_digit = (10 - (bin_sum + _luhn_sum(pad, True)) % 10) % 10
+        cards.append(bin_number + pad + str(check_digit))
+    return cards
+
+def format_card(card_number: str, card_type: str) -> str:
+    """Group a card number for display based on its type"""
+    if card_type == "American Express":
+        return f"{card_number[:4]} {card_number[4:10]} {card_number[10:]}"
+    if len(card_number) == 16:
+        return f"{card_number[:4]} {card_number[4:8]} {card_number[8:12]} {card_number[12:]}"
+    return ' '.join([card_number[i:i+4] for i in range(0, len(card_number), 4)])
+
+def generate_exp_date() -> tuple[str, str]:
+    """Generate random expiration date"""
+    current_year = datetime.now().year
+    month = f"{_rng.randint(1,12):02}"
+    year = str(_rng.randint(current_year + 1, current_year + 6))
+    return month, year
+
+def generate_cvv() -> str:
+    """Generate random CVV"""
+    return f"{_rng.randrange(1000):03d}"
+
+# ------------------- Validation Functions -------------------
+
+# Up to this many entries, every failed check is listed; beyond it Luhn is
+# skipped for entries that already failed the cheaper CVV or expiry checks
+FULL_REASONS_LIMIT = 200
+
+def validate_cc_entries(entries: Sequence[str], full_reasons: bool | None = None) -> Iterator[str]:
+    """Validate "number|mm|yyyy|cvv" entries with digits-only numbers, yielding result lines"""
+    if full_reasons is None:
+        full_reasons = len(entries) <= FULL_REASONS_LIMIT
+    valid_count = 0
+    total_count = 0
+    now = datetime.now()
+    current_year, current_month = now.year, now.month
+    
+    for entry in entries:
+        if not entry.strip():
+            continue
+            
+        total_count += 1
+        parts = entry.split("|")
+        if len(parts) < 4:
+            yield f"[Invalid Format] {entry}"
+            continue
+
+        cc_number, month, year, cvv = parts[0], parts[1], parts[2], parts[3]
+        if not (cc_number.isascii() and cc_number.isdigit()):
+            yield f"[Invalid Number] {entry}"
+            continue
+        
+        # Cheapest checks first; Luhn may be skipped (None) once the entry is invalid
+        cvv_valid = validate_cvv(cvv)
+        exp_valid = _exp_valid(month, year, current_year, current_month)
+        card_type = get_card_type(cc_number)
+        luhn_valid: bool | None
+        if (cvv_valid and exp_valid) or full_reasons:
+            luhn_valid = luhn_check(cc_number)
+        else:
+            luhn_valid = None
+        is_valid = cvv_valid and exp_valid and luhn_valid
+        
+        if is_valid:
+            valid_count += 1
+
+        formatted_cc = format_card(cc_number, card_type)
+
+        status = "VALID" if is_valid else "INVALID"
+        result_text = f"{formatted_cc} ({card_type}) → {status}"
+        
+        # Add details for invalid cards
+        if not is_valid:
+            reasons = []
+            if luhn_valid is False:
+                reasons.append("Luhn check failed")
+            if not exp_valid:
+                reasons.append("Expired or invalid date")
+            if not cvv_valid:
+                reasons.append("Invalid CVV")
+            result_text += f" [{', '.join(reasons)}]"
+        
+        yield result_text
+
+    # Add summary
+    yield f"\nSummary: {valid_count}/{total_count} valid cards"